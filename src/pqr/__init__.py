@@ -1,12 +1,9 @@
 from __future__ import annotations
 
-from .main import app, cli
-from .main.settings import PRINT_SETTINGS
+from .main import cli
 
 
 def main() -> None:
-    PRINT_SETTINGS.load()
-
-    app.load_config(user=False)
-
+    # Print settings and config files are loaded lazily, only once a command that
+    # needs them runs. e.g. `--help`, `--version` and `edit` never read them.
     cli.cli()
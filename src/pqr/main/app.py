@@ -1,22 +1,26 @@
 from __future__ import annotations
 
+import functools
+import itertools
+import os
+import re
 import sys
+import textwrap
 from datetime import UTC, datetime
-from typing import TYPE_CHECKING
+from operator import attrgetter
+from typing import TYPE_CHECKING, NamedTuple
 
 from rich.box import HEAVY
-from rich.columns import Columns
-from rich.console import Group
 from rich.panel import Panel
-from rich.prompt import FloatPrompt, IntPrompt, Prompt
-from rich.syntax import Syntax
+from rich.prompt import FloatPrompt, IntPrompt, Prompt, PromptBase
 from rich.table import Table
+from rich.text import Text
 
-from . import errors, helpers, qr, ui
+from . import errors, helpers, ui
 from .config import CONFIG, ConfigManager
 from .errors import ConfigReadError, ConfigValidationError
-from .shared import App, Encoding, Key, StringTransformation, console
-from .ui import INDENT
+from .shared import App, Category, Encoding, Key, StringTransformation, console
+from .ui import INDENT, INDENT_WIDTH
 
 
 if TYPE_CHECKING:
@@ -25,6 +29,34 @@ if TYPE_CHECKING:
     from .settings import PrintSettings
 
 
+# Indentation for prompts nested under a category header.
+PROMPT_INDENT = INDENT * 3
+
+# Prompt used to ask for a setting's value, keyed by the setting's type. Falls back to
+# `Prompt` for any types not listed here.
+PROMPTS: dict[type, type[PromptBase]] = {
+    int: IntPrompt,
+    float: FloatPrompt,
+}
+
+# Header printed above each category's prompts, keyed by the category.
+CATEGORY_HEADERS: dict[Category, str] = {
+    category: f"{INDENT * 2}[magenta]{category.capitalize()} Settings[/magenta]"
+    for category in Category
+}
+
+# Matches the keys in the QR Code stats and the color 'dracula' gives them.
+STATS_KEY_PATTERN = re.compile(r"^\w+(?=:)", flags=re.MULTILINE)
+STATS_KEY_STYLE = "#ff79c6"
+
+
+# The pieces of the revising preview rendered from a QR Code's data.
+class RenderedQRCode(NamedTuple):
+    data: Text
+    stats: Text
+    ascii: Text
+
+
 def load_config(user: bool) -> None:
     try:
         CONFIG.load(user)
@@ -51,8 +83,7 @@ def save_print_settings_file(
 
     ui.print_panel(
         f"[{style1}]Creating {text_filename} in {text_destination}...[/{style1}]",
-        #              t  r            b  l
-        padding_outer=(1, len(INDENT), 0, len(INDENT)),
+        padding_outer=ui.PADDING_OUTER_NO_BOTTOM,
     )
 
     if destination.exists() and force is False:
@@ -61,7 +92,7 @@ def save_print_settings_file(
         )
         return
 
-    destination.write_text(print_settings.dump())
+    destination.write_bytes(print_settings.dump().encode())
 
 
 def save_config_file(
@@ -83,19 +114,39 @@ def save_config_file(
 
     ui.print_panel(
         f"[{style1}]Initializing user config file in {text_destination}...[/{style1}]",
-        #              t  r            b  l
-        padding_outer=(1, len(INDENT), 0, len(INDENT)),
+        padding_outer=ui.PADDING_OUTER_NO_BOTTOM,
     )
 
-    helpers.copy_file(source, destination, create_destination, force)
+    # The header is prepended in memory so the config file is written only once.
+    helpers.write_file(
+        config_file,
+        build_config_file_header(config_file, source),
+        create_destination,
+        force,
+    )
 
-    config_file.write_text(build_config_file_header(config_file))
+    is_user_config_setup.cache_clear()
+    CONFIG.clear_config_file_override_paths()
 
 
-def build_config_file_header(path: Path, width: int = 88) -> str:
+def build_config_file_header(path: Path, source: Path, width: int = 88) -> str:
     comment_prefix = "# "
 
-    header = Panel(
+    return (
+        f"{comment_prefix}{helpers.format_path(path)}\n"
+        f"{comment_prefix.strip()}\n"
+        f"{_render_config_file_banner(comment_prefix, width)}\n"
+        f"\n"
+        f"\n"
+        f"\n"
+        f"{source.read_bytes().decode().strip()}"
+    )
+
+
+@functools.cache
+def _render_config_file_banner(comment_prefix: str, width: int) -> str:
+    # The banner only contains constants so it's rendered a single time.
+    banner = Panel(
         "\n".join(
             [
                 App.NAME_FULL,
@@ -110,41 +161,21 @@ def build_config_file_header(path: Path, width: int = 88) -> str:
 
     # Capture the rendered output.
     with console.capture() as capture:
-        console.print(header)
-
-    header = capture.get()
-
-    header = "\n".join(
-        [f"{comment_prefix}{line}" for line in header.splitlines()],
-    )
-
-    header = "".join(
-        [
-            f"{comment_prefix}{helpers.format_path(path)}",
-            f"\n{comment_prefix}",
-            f"\n{header}",
-            "\n",
-            "\n",
-            "\n",
-            "\n",
-            f"{path.read_text().strip()}",
-        ]
-    )
-
-    header = "\n".join(
-        [line.strip() for line in header.splitlines()],
-    )
+        console.print(banner)
 
-    return header
+    return textwrap.indent(capture.get().rstrip("\n"), comment_prefix)
 
 
+@functools.cache
 def is_user_config_setup() -> bool:
-    required_items = [
-        App.PATH_USER_DATA,
-        App.PATH_USER_DATA / App.NAME_CONFIG_FILE,
-    ]
+    # The config file existing implies its directory does too, so a single `stat` is
+    # enough. The result is cached until `save_config_file` writes a new config file.
+    try:
+        os.stat(App.PATH_USER_DATA / App.NAME_CONFIG_FILE)
+    except FileNotFoundError:
+        return False
 
-    return all(item.exists() for item in required_items)
+    return True
 
 
 def print_ignore_defaults_note() -> None:
@@ -170,45 +201,34 @@ def prompt_print_settings(
     add_date: bool,
     date_template: str,
 ) -> PrintSettings:
-    category = None
-    first_line = True
-
-    for setting in print_settings.iter_settings():
-        if category != setting.category:
-            category = setting.category
-
-            new_line = "" if first_line is True else "\n"
+    groups = itertools.groupby(
+        print_settings.iter_settings(), key=attrgetter("category")
+    )
 
-            console.print(
-                f"{new_line}{INDENT * 2}[magenta]{category.capitalize()} Settings[/magenta]"
-            )
+    for index, (category, settings) in enumerate(groups):
+        new_line = "" if index == 0 else "\n"
 
-            first_line = False
+        console.print(f"{new_line}{CATEGORY_HEADERS[category]}")
 
-        # Special handling for the date.
-        if setting.name == Key.DATE:
-            if add_date is True:
-                print_settings.date = prompt_date(
-                    date_template,
-                    print_settings.date.value or None,  # pyright: ignore [reportArgumentType]
-                )
+        for setting in settings:
+            # Special handling for the date.
+            if setting.name == Key.DATE:
+                if add_date is True:
+                    print_settings.date = prompt_date(
+                        date_template,
+                        print_settings.date.value or None,  # pyright: ignore [reportArgumentType]
+                    )
 
-            continue
+                continue
 
-        match setting.type:
-            case i if i is int:
-                prompt = IntPrompt
-            case f if f is float:
-                prompt = FloatPrompt
-            case _:
-                prompt = Prompt
+            prompt = PROMPTS.get(setting.type, Prompt)
 
-        prompt_text = f"{INDENT * 3}{setting.description_formatted()}"
-        default = None if ignore_defaults is True else (setting.value or None)
+            prompt_text = f"{PROMPT_INDENT}{setting.description_formatted()}"
+            default = None if ignore_defaults is True else (setting.value or None)
 
-        reply = prompt.ask(prompt_text, default=default)
+            reply = prompt.ask(prompt_text, default=default)
 
-        setting.update(reply)
+            setting.update(reply)
 
     return print_settings
 
@@ -217,7 +237,7 @@ def prompt_date(date_template: str, date: str | None = None) -> str:
     # Initially we need to get the date template string from the user...
     if date is None:
         date = Prompt.ask(
-            prompt=f"{INDENT * 3}Date template string",
+            prompt=f"{PROMPT_INDENT}Date template string",
             default=date_template,
         )
         date = datetime.now(tz=UTC).strftime(date)
@@ -225,7 +245,7 @@ def prompt_date(date_template: str, date: str | None = None) -> str:
     else:
         # ...on a revising pass, we allow the user to edit the formatted date.
         date = Prompt.ask(
-            prompt=f"{INDENT * 3}Current date",
+            prompt=f"{PROMPT_INDENT}Current date",
             default=date,
         )
 
@@ -243,45 +263,66 @@ def revise_print_settings(  # noqa: PLR0913, PLR0914, PLR0917
     filename_transformations: list[StringTransformation],
     caption_templates: tuple[str, str],
 ) -> PrintSettings:
+    # Syntax pulls in Pygments, and qr pulls in Pillow and qrcode, so these are only
+    # imported once a preview is shown.
+    from rich.columns import Columns
+    from rich.console import Group
+    from rich.syntax import Syntax
+
+    from . import qr
+
     color_style = "cyan"
 
-    while True:
-        qr_code_data = print_settings.to_encoded_str(encoding, with_units)
+    # The rendered pieces of the preview keyed by the QR Code data. Everything they show
+    # is derived from the data, so passes that leave it untouched reuse them.
+    rendered_qr_codes: dict[str, RenderedQRCode] = {}
 
+    # The config doesn't change while revising so its values are only looked up once.
+    version = CONFIG.cfg.qr_code.version
+    error_correction = CONFIG.cfg.qr_code.error_correction
+    module_size = CONFIG.cfg.qr_code.module_size
+    border = CONFIG.cfg.qr_code.border
+    suffix = CONFIG.cfg.qr_code.format.to_suffix()
+    encoding_name = CONFIG.cfg.options.encoding.value
+
+    render_filename = helpers.compile_template(filename_template)
+    render_caption = helpers.compile_template("\n".join(caption_templates))
+
+    last_template_context = None
+    filename = ""
+    caption = ""
+
+    def render_qr_code(qr_code_data: str) -> RenderedQRCode:
         qr_code = qr.generate_qr_code(
             qr_code_data,
-            version=CONFIG.cfg.qr_code.version,
-            error_correction=CONFIG.cfg.qr_code.error_correction.to_const(),
-            module_size=CONFIG.cfg.qr_code.module_size,
-            border=CONFIG.cfg.qr_code.border,
+            version=version,
+            error_correction=error_correction.to_const(),
+            module_size=module_size,
+            border=border,
         )
 
-        # Panel: QR Code data ----------------------------------------------------------------------
-
-        theme = "dracula"
-
+        # Rendering a `Syntax` re-runs Pygments every time, so the highlighted text is
+        # kept and rendered instead.
         syntax_qr_code_data = Syntax(
             code=qr_code_data,
             lexer=encoding.lexer,
-            theme=theme,
+            theme="dracula",
             background_color="default",
         )
 
-        panel_qr_code_data = ui.panel(
-            syntax_qr_code_data,
-            title="Data",
-            #              t  r  b  l
-            padding_outer=(1, 0, 0, 1),
-        )
+        text_qr_code_data = syntax_qr_code_data.highlight(qr_code_data)
 
-        # Panel: Stats -----------------------------------------------------------------------------
+        # Pygments always ends the highlighted text with a newline. Like `Syntax`, only
+        # keep it if the data ends with one e.g. TOML, so it renders the same.
+        if not qr_code_data.endswith("\n"):
+            text_qr_code_data.remove_suffix("\n")
 
         qr_code_stats = "\n".join(
             [
-                f"encoding: {CONFIG.cfg.options.encoding.value}",
+                f"encoding: {encoding_name}",
                 f"version: {qr_code.version}",
                 f"modules: {qr_code.modules_count} x {qr_code.modules_count}",
-                f"error: {CONFIG.cfg.qr_code.error_correction.value}",
+                f"error: {error_correction.value}",
                 f"size: {len(qr_code_data.encode('utf-8'))}",
             ]
         )
@@ -290,15 +331,40 @@ def revise_print_settings(  # noqa: PLR0913, PLR0914, PLR0917
         panel_width = ui.get_char_max_width(qr_code_data)
         qr_code_stats = ui.pad_lines(qr_code_stats, panel_width)
 
-        syntax_qr_code_stats = Syntax(
-            code=qr_code_stats,
-            lexer="yaml",
-            theme=theme,
-            background_color="default",
+        # The stats are simple 'key: value' lines so only the keys are highlighted,
+        # matching the theme's colors, rather than running them through Pygments.
+        text_qr_code_stats = Text(qr_code_stats)
+        text_qr_code_stats.highlight_regex(STATS_KEY_PATTERN, style=STATS_KEY_STYLE)
+
+        return RenderedQRCode(
+            data=text_qr_code_data,
+            stats=text_qr_code_stats,
+            # Kept as `Text` so Rich doesn't parse the preview for markup on every render.
+            ascii=Text(qr.to_ascii(qr_code)),
         )
 
+    while True:
+        qr_code_data = print_settings.to_encoded_str(encoding, with_units)
+
+        rendered_qr_code = rendered_qr_codes.get(qr_code_data)
+
+        if rendered_qr_code is None:
+            rendered_qr_code = render_qr_code(qr_code_data)
+            rendered_qr_codes[qr_code_data] = rendered_qr_code
+
+        # Panel: QR Code data ----------------------------------------------------------------------
+
+        panel_qr_code_data = ui.panel(
+            rendered_qr_code.data,
+            title="Data",
+            #              t  r  b  l
+            padding_outer=(1, 0, 0, 1),
+        )
+
+        # Panel: Stats -----------------------------------------------------------------------------
+
         panel_qr_code_stats = ui.panel(
-            syntax_qr_code_stats,
+            rendered_qr_code.stats,
             title="Stats",
             #              t  r  b  l
             padding_outer=(0, 0, 0, 1),
@@ -308,21 +374,23 @@ def revise_print_settings(  # noqa: PLR0913, PLR0914, PLR0917
 
         template_context = print_settings.to_template_context()
 
-        basename = helpers.generate_basename(
-            template=filename_template,
-            template_context=template_context,
-            string_transformations=filename_transformations,
-        )
+        # The same context is returned until a setting changes, so the filename and
+        # caption only need to be rendered again when a new one comes back.
+        if template_context is not last_template_context:
+            basename = helpers.apply_string_transformations(
+                render_filename(template_context),
+                filename_transformations,
+            )
 
-        filename = f"filename: [yellow]{basename}{CONFIG.cfg.qr_code.format.to_suffix()}[/yellow]"
+            filename = f"filename: [yellow]{basename}{suffix}[/yellow]"
 
-        caption = "\n".join(caption_templates).format(**template_context)
+            caption = render_caption(template_context)
 
-        qr_code_ascii = qr.to_ascii(qr_code)
+            last_template_context = template_context
 
         table_qr_code = Table.grid(pad_edge=True, padding=1)
         table_qr_code.add_column(justify="center")
-        table_qr_code.add_row(qr_code_ascii)
+        table_qr_code.add_row(rendered_qr_code.ascii)
         table_qr_code.add_row(caption)
 
         panel_qr_code = ui.panel(
@@ -332,7 +400,7 @@ def revise_print_settings(  # noqa: PLR0913, PLR0914, PLR0917
             #        t  r  b  l
             padding=(2, 6, 0, 6),
             #              t  r  b  l
-            padding_outer=(1, 1, 1, len(INDENT)),
+            padding_outer=(1, 1, 1, INDENT_WIDTH),
         )
 
         # ------------------------------------------------------------------------------------------
@@ -1,34 +1,27 @@
 from __future__ import annotations
 
 import inspect
+import re
 import sys
-from collections import defaultdict
 from datetime import UTC, datetime
 from enum import StrEnum
 from inspect import Parameter, Signature
 from pathlib import Path
-from types import SimpleNamespace
-from typing import TYPE_CHECKING, Annotated
+from typing import TYPE_CHECKING, Annotated, NamedTuple
 
 from typer import Argument, BadParameter, Exit, Option, Typer
 
-from . import app, errors, helpers, qr, ui
+from . import app, errors, helpers, ui
 from .config import CONFIG, read_serialized_data
 from .errors import ConfigReadError
-from .settings import PRINT_SETTINGS, Setting
-from .shared import App, Delimeter, Encoding, Key, StringTransformation, console
-from .tables import (
-    TABLE_STRING_TRANSFORMATIONS,
-    TABLE_TEMPLATES_DATE,
-    TABLE_TEMPLATES_FIELDS,
-)
+from .settings import PRINT_SETTINGS
+from .shared import App, Encoding, Key, StringTransformation, console
 
 
 if TYPE_CHECKING:
     from collections.abc import Callable
 
-
-PATH_CWD = Path.cwd()
+    from .settings import PrintSettings
 
 
 TYPER_CONFIG = {
@@ -52,7 +45,7 @@ cli = Typer(
 
 def version_callback(value: bool) -> None:
     if value:
-        console.print(f"{App.NAME_FULL} [green]v{App.VERSION}[/green]")
+        console.print(f"{App.NAME_FULL} [green]v{App.version()}[/green]")
         raise Exit
 
 
@@ -83,15 +76,24 @@ def main_cli(
 # Validation ---------------------------------------------------------------------------------------
 
 
+# Directives supported by `strftime` on every platform i.e. the C89 ones and those
+# `datetime` handles itself, and a pattern matching the directive following each '%'.
+# Anything else e.g. the ISO 8601 '%G', '%u' and '%V' is checked with `strftime`.
+DATE_TEMPLATE_DIRECTIVES = frozenset("aAwdbBmyYHIpMSfzZjUWcxX%")
+DATE_TEMPLATE_DIRECTIVE_PATTERN = re.compile(r"%(.?)", flags=re.DOTALL)
+
+
 def validate_template_string(value: str | list[str] | None) -> str | list[str] | None:
     if value is None:
         return value
 
     strings = [value] if isinstance(value, str) else value
 
+    template_context = PRINT_SETTINGS.to_template_context()
+
     for string in strings:
         try:
-            string.format(**PRINT_SETTINGS.to_template_context())
+            string.format_map(template_context)
         except Exception as error:  # noqa: PERF203
             raise BadParameter(string) from error
 
@@ -102,6 +104,14 @@ def validate_date_template(value: str | None) -> str | None:
     if value is None:
         return None
 
+    # Templates using only standard directives always format, so formatting a date to
+    # probe the template is only needed for anything else e.g. platform specific ones.
+    if all(
+        directive in DATE_TEMPLATE_DIRECTIVES
+        for directive in DATE_TEMPLATE_DIRECTIVE_PATTERN.findall(value)
+    ):
+        return value
+
     try:
         datetime.now(tz=UTC).strftime(value)
     except Exception as error:
@@ -120,6 +130,8 @@ arg_output_directory = Annotated[
         "--output",
         help="File output directory. [dim]default: current directory[/dim]",
         show_default=False,
+        # Resolved when the command runs rather than when the module is imported.
+        default_factory=Path.cwd,
     ),
 ]
 
@@ -224,6 +236,19 @@ arg_force = Annotated[
 ]
 
 
+class SharedArgs(NamedTuple):
+    output_directory: Path
+    ignore_defaults: bool
+    encoding: Encoding
+    add_caption: bool
+    add_date: bool
+    with_units: bool
+    date_template: str
+    filename_template: str
+    filename_transformations: list[StringTransformation]
+    caption_templates: tuple[str, str]
+
+
 # NOTE: Until there's a better way to share command level args this is the simplest way
 # we can process shared args between different commands.
 #
@@ -242,7 +267,7 @@ def process_shared_args(  # noqa: PLR0913, PLR0917
     filename_template: str | None,
     filename_transformations: list[StringTransformation] | None,
     caption_templates: tuple[str, str] | None,
-) -> SimpleNamespace:
+) -> SharedArgs:
     if not app.is_user_config_setup():
         app.save_config_file()
 
@@ -252,27 +277,30 @@ def process_shared_args(  # noqa: PLR0913, PLR0917
 
     output_directory = output_directory.resolve()
 
+    app.load_config(user=ignore_defaults is False)
+
     if ignore_defaults is False:
-        app.load_config(user=True)
         app.print_ignore_defaults_note()
 
-    encoding = encoding or CONFIG.cfg.options.encoding
-    add_caption = (
-        add_caption if add_caption is not None else CONFIG.cfg.options.add_caption
-    )
-    add_date = add_date if add_date is not None else CONFIG.cfg.options.add_date
-    with_units = with_units if with_units is not None else CONFIG.cfg.options.with_units
-    date_template = date_template or CONFIG.cfg.template.date
-    filename_template = filename_template or CONFIG.cfg.template.filename
+    # Defaults for any args that weren't passed in.
+    options = CONFIG.cfg.options
+    template = CONFIG.cfg.template
+
+    encoding = encoding or options.encoding
+    add_caption = add_caption if add_caption is not None else options.add_caption
+    add_date = add_date if add_date is not None else options.add_date
+    with_units = with_units if with_units is not None else options.with_units
+    date_template = date_template or template.date
+    filename_template = filename_template or template.filename
     filename_transformations = (
-        filename_transformations or CONFIG.cfg.template.filename_transformations
+        filename_transformations or template.filename_transformations
     )
     caption_templates = caption_templates or (
-        CONFIG.cfg.template.caption_line_one,
-        CONFIG.cfg.template.caption_line_two,
+        template.caption_line_one,
+        template.caption_line_two,
     )
 
-    namespace = SimpleNamespace(
+    args = SharedArgs(
         output_directory=output_directory,
         ignore_defaults=ignore_defaults,
         encoding=encoding,
@@ -287,13 +315,44 @@ def process_shared_args(  # noqa: PLR0913, PLR0917
 
     if CONFIG.debug:
         ui.print_panel(
-            namespace.__dict__,
+            args._asdict(),
             pretty=True,
             title="Shared Command Args",
             border_style="red",
         )
 
-    return namespace
+    return args
+
+
+def revise_and_generate_qr_code(
+    print_settings: PrintSettings,
+    args: SharedArgs,
+) -> None:
+    print_settings = app.revise_print_settings(
+        print_settings,
+        args.ignore_defaults,
+        args.encoding,
+        args.with_units,
+        args.add_date,
+        args.date_template,
+        args.filename_template,
+        args.filename_transformations,
+        args.caption_templates,
+    )
+
+    # Imported only once a QR Code is saved as it pulls in Pillow and qrcode.
+    from . import qr
+
+    qr.generate_and_save_qr_code(
+        print_settings,
+        args.add_caption,
+        args.with_units,
+        args.encoding,
+        args.output_directory,
+        args.filename_template,
+        args.filename_transformations,
+        args.caption_templates,
+    )
 
 
 # Command: prompts ---------------------------------------------------------------------------------
@@ -305,7 +364,7 @@ def process_shared_args(  # noqa: PLR0913, PLR0917
     rich_help_panel="Generate",
 )
 def run_command_generate_from_prompts(  # noqa: PLR0913, PLR0917
-    output_directory: arg_output_directory = PATH_CWD,
+    output_directory: arg_output_directory,
     ignore_defaults: arg_ignore_defaults = False,
     encoding: arg_encoding = None,
     with_units: arg_with_units = None,
@@ -338,35 +397,14 @@ def run_command_generate_from_prompts(  # noqa: PLR0913, PLR0917
         args.date_template,
     )
 
-    print_settings = app.revise_print_settings(
-        print_settings,
-        args.ignore_defaults,
-        args.encoding,
-        args.with_units,
-        args.add_date,
-        args.date_template,
-        args.filename_template,
-        args.filename_transformations,
-        args.caption_templates,
-    )
-
-    qr.generate_and_save_qr_code(
-        print_settings,
-        args.add_caption,
-        args.encoding,
-        args.with_units,
-        args.output_directory,
-        args.filename_template,
-        args.filename_transformations,
-        args.caption_templates,
-    )
+    revise_and_generate_qr_code(print_settings, args)
 
 
 # Command: args ------------------------------------------------------------------------------------
 
 
 def run_command_generate_from_args(  # noqa: PLR0913, PLR0917
-    output_directory: arg_output_directory = PATH_CWD,
+    output_directory: arg_output_directory,
     ignore_defaults: arg_ignore_defaults = False,
     encoding: arg_encoding = None,
     with_units: arg_with_units = None,
@@ -393,45 +431,22 @@ def run_command_generate_from_args(  # noqa: PLR0913, PLR0917
         caption_templates,
     )
 
-    # Convert the flattened dictionary into a nested one for updaing `PRINT_SETTINGS`.
-    data = defaultdict(dict)
-    for path, value in print_settings.items():
-        # This can throw an error but it should never happen as we're just reversing
-        # what's done in the wrapper function below. If it errors out it's a bug.
-        category, name = Setting.deconstruct_fully_qualified_path(
-            path, delimeter=Delimeter.SNAKE
-        )
-
-        data[category][name] = value
-
+    # The args are keyed by the settings' normalized paths, as set up in the wrapper
+    # function below, so they can be applied without rebuilding the nested data.
     # TODO: We need to run validation before this data is used for updating.
-    PRINT_SETTINGS.update(data)
+    PRINT_SETTINGS.update_flat(print_settings)
 
     if add_date is True:
         PRINT_SETTINGS.stamp_date(args.date_template)
 
-    print_settings = app.revise_print_settings(
-        PRINT_SETTINGS,
-        args.ignore_defaults,
-        args.encoding,
-        args.with_units,
-        args.add_date,
-        args.date_template,
-        args.filename_template,
-        args.filename_transformations,
-        args.caption_templates,
-    )
+    revise_and_generate_qr_code(PRINT_SETTINGS, args)
 
-    qr.generate_and_save_qr_code(
-        print_settings,
-        args.add_caption,
-        args.with_units,
-        args.encoding,
-        args.output_directory,
-        args.filename_template,
-        args.filename_transformations,
-        args.caption_templates,
-    )
+
+# Options shared by every print setting arg.
+PRINT_SETTINGS_OPTION = {
+    "rich_help_panel": "Print Settings",
+    "show_default": False,
+}
 
 
 def _wrapper_run_command_generate_from_args() -> Callable:
@@ -454,30 +469,24 @@ def _wrapper_run_command_generate_from_args() -> Callable:
 
     original_parameters = list(original_parameters.values())
 
-    # Compile print settings.
-    print_settings = []
-
-    # Build a list of parameters to inject into the generate from args function.
-    for setting in PRINT_SETTINGS.iter_settings():
-        # Special handling for the date. Ignore!
-        if setting.name == Key.DATE:
-            continue
-
-        parameter = Parameter(
+    # Build a list of parameters to inject into the generate from args function. The
+    # date gets special handling and is ignored here.
+    print_settings = [
+        Parameter(
             name=setting.path_normalized,
             kind=Parameter.POSITIONAL_OR_KEYWORD,
             annotation=Annotated[
                 setting.type,
                 Option(
                     help=setting.description_formatted(),
-                    rich_help_panel="Print Settings",
-                    show_default=False,
+                    **PRINT_SETTINGS_OPTION,  # pyright: ignore [reportArgumentType]
                 ),
             ],
             default=setting.value or None,
         )
-
-        print_settings.append(parameter)
+        for setting in PRINT_SETTINGS.iter_settings()
+        if setting.name != Key.DATE
+    ]
 
     parameters = original_parameters + print_settings
 
@@ -511,7 +520,7 @@ def run_command_generate_from_template(  # noqa: PLR0913, PLR0917
             show_default=False,
         ),
     ],
-    output_directory: arg_output_directory = PATH_CWD,
+    output_directory: arg_output_directory,
     ignore_defaults: arg_ignore_defaults = False,
     encoding: arg_encoding = None,
     with_units: arg_with_units = None,
@@ -551,28 +560,7 @@ def run_command_generate_from_template(  # noqa: PLR0913, PLR0917
     if add_date is True:
         PRINT_SETTINGS.stamp_date(args.date_template)
 
-    print_settings = app.revise_print_settings(
-        PRINT_SETTINGS,
-        args.ignore_defaults,
-        args.encoding,
-        args.with_units,
-        args.add_date,
-        args.date_template,
-        args.filename_template,
-        args.filename_transformations,
-        args.caption_templates,
-    )
-
-    qr.generate_and_save_qr_code(
-        print_settings,
-        args.add_caption,
-        args.with_units,
-        args.encoding,
-        args.output_directory,
-        args.filename_template,
-        args.filename_transformations,
-        args.caption_templates,
-    )
+    revise_and_generate_qr_code(PRINT_SETTINGS, args)
 
 
 # Command: revise ----------------------------------------------------------------------------------
@@ -584,7 +572,7 @@ def run_command_generate_from_template(  # noqa: PLR0913, PLR0917
     rich_help_panel="Generate",
 )
 def run_command_generate_from_history(  # noqa: PLR0913, PLR0917
-    output_directory: arg_output_directory = PATH_CWD,
+    output_directory: arg_output_directory,
     ignore_defaults: arg_ignore_defaults = False,
     encoding: arg_encoding = None,
     with_units: arg_with_units = None,
@@ -625,28 +613,7 @@ def run_command_generate_from_history(  # noqa: PLR0913, PLR0917
     if add_date is True:
         PRINT_SETTINGS.stamp_date(args.date_template)
 
-    print_settings = app.revise_print_settings(
-        PRINT_SETTINGS,
-        args.ignore_defaults,
-        args.encoding,
-        args.with_units,
-        args.add_date,
-        args.date_template,
-        args.filename_template,
-        args.filename_transformations,
-        args.caption_templates,
-    )
-
-    qr.generate_and_save_qr_code(
-        print_settings,
-        args.add_caption,
-        args.with_units,
-        args.encoding,
-        args.output_directory,
-        args.filename_template,
-        args.filename_transformations,
-        args.caption_templates,
-    )
+    revise_and_generate_qr_code(PRINT_SETTINGS, args)
 
 
 # Sub-command: init --------------------------------------------------------------------------------
@@ -734,15 +701,18 @@ def run_command_info(
 ) -> None:
     """Print reference tables."""
 
+    # Only the requested table is built, so the tables are imported here too.
+    from . import tables
+
     app.load_config(user=True)
 
     match table:
         case ChoiceReferenceTable.DATE:
-            console.print(TABLE_TEMPLATES_DATE)
+            console.print(tables.generate_table_template_date())
         case ChoiceReferenceTable.FIELDS:
-            console.print(TABLE_TEMPLATES_FIELDS)
+            console.print(tables.generate_table_template_fields())
         case ChoiceReferenceTable.TRANSFORMATIONS:
-            console.print(TABLE_STRING_TRANSFORMATIONS)
+            console.print(tables.generate_table_string_transformations())
 
 
 # Command: edit ------------------------------------------------------------------------------------
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import os
 from pathlib import Path
 from typing import Literal
 
@@ -14,8 +15,8 @@ from pydantic import (
 from pydantic_core import InitErrorDetails, PydanticCustomError
 
 from . import helpers
-from .errors import ConfigReadError, ConfigValidationError
-from .settings import PRINT_SETTINGS, SerializedSettings, Setting
+from .errors import ConfigReadError, ConfigValidationError, InternalError
+from .settings import PRINT_SETTINGS, SerializedSettings
 from .shared import (
     QR_CODE_VERSION_MAX,
     QR_CODE_VERSION_MIN,
@@ -38,12 +39,14 @@ QrCodeVersion = (
 
 
 class BaseConfig(BaseModel):
-    # Accept both `field-name` and `field_name` as valid keys.
+    # Accept both `field-name` and `field_name` as valid keys. Validators are only built
+    # once a config is first loaded, so commands that never read the config skip them.
     model_config = ConfigDict(
         alias_generator=AliasGenerator(
             validation_alias=helpers.snake_to_kebab,
             serialization_alias=helpers.kebab_to_snake,
-        )
+        ),
+        defer_build=True,
     )
 
 
@@ -89,19 +92,14 @@ class Config(BaseConfig):
     slicer: Slicer
     print_settings: dict
 
-    @classmethod
     @field_validator("print_settings")
+    @classmethod
     def validate_print_settings(cls, data: SerializedSettings) -> dict:
         errors: list[InitErrorDetails] = []
 
         for category, settings in data.items():
             for setting_name, setting_value in settings.items():
-                path = Setting.build_fully_qualified_path(
-                    category,
-                    setting_name,
-                )
-
-                setting = PRINT_SETTINGS.get(path)
+                setting = PRINT_SETTINGS.get_by_category(category, setting_name)
 
                 if setting is None:
                     errors.append(
@@ -134,11 +132,12 @@ class Config(BaseConfig):
                         )
                     )
 
-            if errors:
-                raise ValidationError.from_exception_data(
-                    title=cls.__name__,
-                    line_errors=errors,
-                )
+        # Errors from every category are collected so they're all reported at once.
+        if errors:
+            raise ValidationError.from_exception_data(
+                title=cls.__name__,
+                line_errors=errors,
+            )
 
         return data
 
@@ -150,55 +149,88 @@ class ConfigManager:
         Path.cwd() / App.NAME_CONFIG_FILE,
     )
 
-    __debug: bool = False
-    __inner: Config
+    __slots__ = ("_config", "_loaded_user", "_override_paths", "debug")
+
+    def __init__(self) -> None:
+        self.debug: bool = False
+        self._config: Config | None = None
+        # Whether the loaded config includes the user's override files.
+        self._loaded_user: bool | None = None
+        self._override_paths: list[Path] | None = None
 
     @property
     def cfg(self) -> Config:
         return self._inner
 
-    @property
-    def debug(self) -> bool:
-        return self.__debug
-
-    @debug.setter
-    def debug(self, value: bool) -> None:
-        self.__debug = value
-
     def load(self, user: bool = False) -> None:
+        # Loading the same config files again would only re-validate the same data.
+        if self._config is not None and self._loaded_user is user:
+            return
+
         filepaths = [self.DEFAULT_LOCATION]
 
         if user is True:
             filepaths.extend(self.get_config_file_override_paths())
 
+        # The files are read fresh for every load, so they can be merged in-place
+        # without copying the config merged so far for each file.
         config = {}
+        validated: Config | None = None
 
         for filepath in filepaths:
             data = read_serialized_data(filepath)
-            config = helpers.merge_dicts(config, data)
+            helpers.merge_dicts_into(config, data)
+
+            # The bundled defaults are trusted, so they're only validated by themselves
+            # when there are no overrides. Otherwise each override is validated as it's
+            # merged in, so errors can be traced back to the file that caused them.
+            if filepath is self.DEFAULT_LOCATION and len(filepaths) > 1:
+                continue
 
             try:
-                self.__inner = Config(**config)
+                validated = Config(**config)
             except ValidationError as error:
                 raise ConfigValidationError(error, filepath) from error
 
-        PRINT_SETTINGS.update(data=self.__inner.print_settings)
+        # The last file is always validated, so this only guards against the loop above
+        # being changed to skip it.
+        if validated is None:
+            raise InternalError("Config was loaded without being validated.")
+
+        PRINT_SETTINGS.update(data=validated.print_settings)
+
+        self._config = validated
+        self._loaded_user = user
 
     def get_config_file_override_paths(self) -> list[Path]:
-        paths = []
+        # The paths are probed once as they're needed both for loading the config and
+        # for showing where the defaults came from.
+        if self._override_paths is None:
+            self._override_paths = []
+
+            for location in self.OVERRIDE_LOCATIONS:
+                # Like `Path.exists`, treat any error as the file not existing.
+                try:
+                    os.stat(location)
+                except OSError:
+                    continue
+
+                self._override_paths.append(location)
 
-        for location in self.OVERRIDE_LOCATIONS:
-            if location.exists():
-                paths.append(location)
+        return self._override_paths
 
-        return paths
+    def clear_config_file_override_paths(self) -> None:
+        # Forget the probed paths e.g. after a config file is written. Any config loaded
+        # from them needs to be loaded again too.
+        self._override_paths = None
+        self._loaded_user = None
 
     @property
     def _inner(self) -> Config:
-        if not self.__inner:
+        if self._config is None:
             self.load()
 
-        return self.__inner
+        return self._config  # pyright: ignore [reportReturnType]
 
 
 # TODO: This and `helpers.read_serialized_data` should maybe go somewhere else?
@@ -1,54 +1,66 @@
 from __future__ import annotations
 
-import json
+import functools
 import os
-import shutil
 import subprocess
 from pathlib import Path
+from string import Formatter
+from typing import TYPE_CHECKING
 
 import tomllib
-import yaml
 
 from .shared import App, ConfigFormat, StringTransformation, console
 from .ui import INDENT
 
 
-def copy_file(
-    source: Path,
-    destination: Path,
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+
+def write_file(
+    path: Path,
+    contents: str,
     create_destination: bool = False,
     force: bool = False,
 ) -> None:
-    """Copies a file into a directory.
+    """Writes a file into a directory.
 
     Args:
-        source (Path): Path to source file.
-        destination (Path): Path to destination directory.
-        create_destination (bool): Create the destination if it doesn't exist.
+        path (Path): Path to the file.
+        contents (str): Contents of the file.
+        create_destination (bool): Create the parent directory if it doesn't exist.
         force (bool): Overwrite file if it exists.
     """
 
     style = "yellow"
 
-    destination = destination.resolve() / source.name
+    path = path.resolve()
 
-    text_destination = f"[{style}]{format_path(destination.parent)}[/{style}]"
-    text_filename = f"[{style}]{destination.name}[/{style}]"
+    text_filename = f"[{style}]{path.name}[/{style}]"
 
-    if not destination.parent.exists() and create_destination is True:
-        console.print(
-            f"{INDENT * 2}Created directory {text_destination}.",
-        )
-        destination.parent.mkdir(parents=True)
+    # Let the filesystem report existing items rather than probing for them first.
+    if create_destination is True:
+        try:
+            path.parent.mkdir(parents=True)
+        except FileExistsError:
+            pass
+        else:
+            # The destination is only formatted when it's actually shown.
+            text_destination = f"[{style}]{format_path(path.parent)}[/{style}]"
 
-    if destination.exists() and force is False:
+            console.print(
+                f"{INDENT * 2}Created directory {text_destination}.",
+            )
+
+    try:
+        with path.open(mode="wb" if force is True else "xb") as f:
+            f.write(contents.encode())
+    except FileExistsError:
         console.print(
             f"{INDENT * 2}[red]Warning:[/red] File {text_filename} exists. Skipping!"
         )
         return
 
-    shutil.copy(source, destination)
-
     console.print(f"{INDENT * 2}Created {text_filename}.")
 
 
@@ -67,29 +79,47 @@ def edit_file(path: Path) -> None:
 def read_serialized_data(path: Path) -> dict:
     match path.suffix:
         case ConfigFormat.JSON:
+            import json
+
             with path.open() as f:
                 return json.load(f)
         case ConfigFormat.TOML:
             with path.open(mode="rb") as f:
                 return tomllib.load(f)
         case ConfigFormat.YAML:
+            import yaml
+
+            # Use the libyaml-backed loader when PyYAML was built with it.
+            loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
             with path.open() as f:
-                return yaml.safe_load(f)
+                return yaml.load(f, Loader=loader)  # noqa: S506
 
     raise ValueError(f"Unsupported serialized data format: '{path.name}'.")
 
 
-def merge_dicts(base: dict, overrides: dict) -> dict:
-    def recursive_merge(base: dict, override: dict) -> dict:
-        for key, value in override.items():
-            if isinstance(value, dict) and isinstance(base.get(key), dict):
-                base[key] = recursive_merge(base[key], value)
-            else:
-                base[key] = value
+def merge_dicts_into(destination: dict, overrides: dict) -> None:
+    """Recursively merges the overrides into the destination in-place. Nothing is
+    copied, so the destination takes ownership of the overrides' nested dictionaries
+    and may modify them on later merges.
 
-        return base
+    Args:
+        destination (dict): Dictionary to merge into.
+        overrides (dict): Dictionary to merge from.
+    """
 
-    return recursive_merge(base.copy(), overrides)
+    stack = [(destination, overrides)]
+
+    while stack:
+        destination, source = stack.pop()
+
+        for key, value in source.items():
+            current = destination.get(key)
+
+            if isinstance(value, dict) and isinstance(current, dict):
+                stack.append((current, value))
+            else:
+                destination[key] = value
 
 
 def generate_basename(
@@ -97,12 +127,51 @@ def generate_basename(
     template_context: dict,
     string_transformations: list[StringTransformation],
 ) -> str:
-    basename = template.format(**template_context)
+    basename = compile_template(template)(template_context)
     basename = apply_string_transformations(basename, string_transformations)
 
     return basename
 
 
+@functools.lru_cache(maxsize=64)
+def compile_template(template: str) -> Callable[[dict], str]:
+    """Parses a template string once and returns a function that renders it. Unlike
+    `str.format`, the template isn't re-parsed every time it's rendered. Compiled
+    templates are cached by their template string.
+
+    Args:
+        template (str): Template string using `str.format` syntax.
+
+    Returns:
+        Callable[[dict], str]: Function rendering the template with a template context.
+    """
+
+    formatter = Formatter()
+    parsed = list(formatter.parse(template))
+
+    def render(template_context: dict) -> str:
+        rendered = []
+
+        for literal_text, field_name, format_spec, conversion in parsed:
+            rendered.append(literal_text)
+
+            if field_name is None:
+                continue
+
+            value, _ = formatter.get_field(field_name, (), template_context)
+            value = formatter.convert_field(value, conversion)
+
+            # Nested replacement fields e.g. `{field:{width}}` need rendering too.
+            if format_spec and "{" in format_spec:
+                format_spec = formatter.vformat(format_spec, (), template_context)
+
+            rendered.append(format(value, format_spec or ""))
+
+        return "".join(rendered)
+
+    return render
+
+
 def apply_string_transformations(
     string: str, string_transformations: list[StringTransformation]
 ) -> str:
@@ -114,6 +183,7 @@ def apply_string_transformations(
     return string
 
 
+@functools.lru_cache(maxsize=256)
 def format_path(path: Path) -> str:
     """Returns a compacted string representation of the path:
 
@@ -130,8 +200,11 @@ def format_path(path: Path) -> str:
         str: Formatted path.
     """
 
-    cwd = Path.cwd()
-    home = Path.home()
+    # NOTE: Results are cached as the current and home directories don't change while
+    # the app is running.
+
+    cwd = _get_cwd()
+    home = _get_home()
 
     if path == cwd:
         return "current directory"
@@ -151,6 +224,16 @@ def format_path(path: Path) -> str:
     return str(path)
 
 
+@functools.cache
+def _get_cwd() -> Path:
+    return Path.cwd()
+
+
+@functools.cache
+def _get_home() -> Path:
+    return Path.home()
+
+
 def kebab_to_snake(string: str) -> str:
     return string.replace("-", "_")
 
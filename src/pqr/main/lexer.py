@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import re
 import textwrap
 from typing import ClassVar
 
@@ -21,10 +22,15 @@ from rich.syntax import Syntax
 class CompactLexer(RegexLexer):
     name = "Compact"
 
+    # The syntax itself is all ASCII, so the patterns' character classes don't need to
+    # consider Unicode. Values are still matched by `.` which accepts any character.
+    flags = re.MULTILINE | re.ASCII
+
     tokens: ClassVar = {
         "root": [
-            # Comments
-            (r"^\s*#\s*.*", Comment),
+            # Comments. Only spaces and tabs are allowed around the '#' so a comment
+            # never runs on into the following lines.
+            (r"^[ \t]*#.*", Comment),
             #
             # Blank Headers
             (r"^\[.+\]$", Comment),
@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from io import StringIO
+import functools
 from pathlib import Path
 
 from PIL import Image, ImageDraw, ImageFont
@@ -10,7 +10,6 @@ from . import helpers, ui
 from .config import CONFIG
 from .settings import PrintSettings
 from .shared import App, Encoding, StringTransformation
-from .ui import INDENT
 
 
 def generate_and_save_qr_code(  # noqa: PLR0913, PLR0917
@@ -33,13 +32,16 @@ def generate_and_save_qr_code(  # noqa: PLR0913, PLR0917
         border=CONFIG.cfg.qr_code.border,
     )
 
-    image = qr_code.make_image().get_image()
+    image = _render_qr_code(qr_code)
 
     template_context = print_settings.to_template_context()
 
     if add_caption:
-        caption_line_one = caption_templates[0].format(**template_context)
-        caption_line_two = caption_templates[1].format(**template_context)
+        render_line_one = helpers.compile_template(caption_templates[0])
+        render_line_two = helpers.compile_template(caption_templates[1])
+
+        caption_line_one = render_line_one(template_context)
+        caption_line_two = render_line_two(template_context)
 
         image = _add_caption_to_image(
             image,
@@ -55,27 +57,32 @@ def generate_and_save_qr_code(  # noqa: PLR0913, PLR0917
 
     image_path = output_directory / f"{basename}{CONFIG.cfg.qr_code.format.to_suffix()}"
     image.save(image_path)
-    image.close()
+
+    # Both copies of the QR Code data are written from the same serialized settings.
+    print_settings_data = print_settings.dump().encode()
 
     # Save a copy of the QR Code data in the output directory.
     config_path = output_directory / f"{basename}.toml"
-    config_path.write_text(print_settings.dump())
+    config_path.write_bytes(print_settings_data)
 
     # Save a copy of the QR Code data in the user data directory.
     history_path = App.PATH_USER_DATA / App.NAME_HISTORY_FILE
-    history_path.write_text(print_settings.dump())
+    history_path.write_bytes(print_settings_data)
 
     ui.print_panel(
         "QR Code and TOML print settings saved to "
         f"[cyan]{helpers.format_path(image_path.parent)}[/cyan].",
-        #              t  r            b  l
-        padding_outer=(1, len(INDENT), 0, len(INDENT)),
+        padding_outer=ui.PADDING_OUTER_NO_BOTTOM,
     )
 
-    with Image.open(image_path) as img:
-        img.show()
+    # Show the image that's already in memory rather than reading the saved file back.
+    image.show()
+    image.close()
 
 
+# QR Codes are cached so that saving reuses the one generated for the preview, as
+# does any revising pass that leaves the data untouched. Callers must not modify them.
+@functools.lru_cache(maxsize=4)
 def generate_qr_code(
     data: str,
     version: int | str,
@@ -101,18 +108,69 @@ def generate_qr_code(
     return qr_code
 
 
+def _render_qr_code(qr_code: QRCode) -> Image.Image:
+    # Equivalent to `qr_code.make_image().get_image()`, but one pixel is drawn per
+    # module and then scaled up, instead of drawing every module as a rectangle.
+    size = qr_code.modules_count + qr_code.border * 2
+
+    light = b"\xff"
+    dark = b"\x00"
+
+    border_rows = light * (size * qr_code.border)
+    border_columns = light * qr_code.border
+
+    pixels = [border_rows]
+
+    for row in qr_code.modules:
+        pixels.append(border_columns)
+        pixels.extend(dark if module else light for module in row)
+        pixels.append(border_columns)
+
+    pixels.append(border_rows)
+
+    image = Image.frombytes("L", (size, size), b"".join(pixels)).convert("1")
+
+    return image.resize(
+        (size * qr_code.box_size, size * qr_code.box_size),
+        Image.Resampling.NEAREST,
+    )
+
+
+# Characters for two vertically stacked modules, indexed by `top + (bottom << 1)` where
+# a dark module is `1`. These match the ones used by `QRCode.print_ascii`.
+ASCII_BLOCKS = ("\xa0", "\u2580", "\u2584", "\u2588")
+
+
 def to_ascii(qr_code: QRCode) -> str:
-    with StringIO() as output:
-        qr_code.print_ascii(out=output)
-        qr_code_ascii = output.getvalue()
+    # Equivalent to `qr_code.print_ascii()` without the trailing newline, but built by
+    # walking the modules directly instead of writing every character to a buffer.
+    width = qr_code.modules_count + qr_code.border * 2
+
+    border_row = [False] * width
+    border_columns = [False] * qr_code.border
+
+    # Modules are only `None` before the QR code is made, so they're read as booleans.
+    rows = [border_row] * qr_code.border
+    rows.extend(
+        [*border_columns, *map(bool, row), *border_columns] for row in qr_code.modules
+    )
+    rows.extend([border_row] * qr_code.border)
 
-    qr_code_ascii = qr_code_ascii.split("\n")
+    # Each line represents two rows, so pad out an odd number of rows.
+    if len(rows) % 2:
+        rows.append(border_row)
 
-    # If the last contains no characters remove it.
-    if not qr_code_ascii[-1].strip():
-        qr_code_ascii.pop()
+    lines = []
 
-    return "\n".join(qr_code_ascii)
+    for top, bottom in zip(rows[::2], rows[1::2], strict=True):
+        lines.append(
+            "".join(
+                ASCII_BLOCKS[upper + (lower << 1)]
+                for upper, lower in zip(top, bottom, strict=True)
+            )
+        )
+
+    return "\n".join(lines)
 
 
 def _add_caption_to_image(
@@ -128,18 +186,13 @@ def _add_caption_to_image(
     #
     # TODO: Should we add 'caption.fit-height' be an option?
     font_size_max = CONFIG.cfg.caption.font_size_max
-    font_size = _get_font_size(
+    font = _get_font(
         image.width,
         border_thickness,
         caption_line_one,
         caption_line_two,
     )
 
-    font = ImageFont.truetype(
-        font=str(App.PATH_FONT_CAPTION),
-        size=font_size,
-    )
-
     caption_bbox_height = (
         CONFIG.cfg.caption.padding_top
         + font_size_max
@@ -201,20 +254,16 @@ def _add_caption_to_image(
     return image_with_caption
 
 
-def _get_font_size(
+def _get_font(
     image_width: int,
     border_thickness: int,
     caption_line_one: str,
     caption_line_two: str,
-) -> int:
+) -> ImageFont.FreeTypeFont:
     font_size_max = CONFIG.cfg.caption.font_size_max
-    font_size = font_size_max
 
-    while True:
-        font = ImageFont.truetype(
-            font=str(App.PATH_FONT_CAPTION),
-            size=font_size,
-        )
+    def load_font_if_fits(font_size: int) -> ImageFont.FreeTypeFont | None:
+        font = _load_caption_font(font_size)
 
         bbox_line_one = font.getbbox(caption_line_one)
         bbox_line_one_width = int(bbox_line_one[2] - bbox_line_one[0])
@@ -224,21 +273,48 @@ def _get_font_size(
 
         bbox_width = max(bbox_line_one_width, bbox_line_two_width)
 
-        if bbox_width + border_thickness <= image_width:
-            # Print a warning if the font size had to be reduced.
-            if font_size < font_size_max:
-                ui.print_panel(
-                    f"The caption font size was reduced from [green]{font_size_max}[/green] "
-                    f"to [red]{font_size}[/red] to fit the caption text.",
-                    title="Warning",
-                    border_style="red",
-                    #              t  r            b  l
-                    padding_outer=(1, len(INDENT), 0, len(INDENT)),
-                )
+        return font if bbox_width + border_thickness <= image_width else None
+
+    # Most captions fit at the maximum size so that's tried first.
+    font = load_font_if_fits(font_size_max)
+
+    if font is not None:
+        return font
+
+    # Otherwise binary search for the largest size that fits, as the caption's width
+    # grows with the font size.
+    low = 1
+    high = font_size_max - 1
 
-            return font_size
+    while low <= high:
+        font_size = (low + high) // 2
+        font_candidate = load_font_if_fits(font_size)
 
-        font_size -= 1
+        if font_candidate is None:
+            high = font_size - 1
+        else:
+            font = font_candidate
+            low = font_size + 1
 
-        if font_size < 1:
-            raise ValueError("Font size became too small to fit the caption text.")
+    if font is None:
+        raise ValueError("Font size became too small to fit the caption text.")
+
+    # Print a warning as the font size had to be reduced.
+    ui.print_panel(
+        f"The caption font size was reduced from [green]{font_size_max}[/green] "
+        f"to [red]{font.size}[/red] to fit the caption text.",
+        title="Warning",
+        border_style="red",
+        padding_outer=ui.PADDING_OUTER_NO_BOTTOM,
+    )
+
+    return font
+
+
+@functools.lru_cache(maxsize=16)
+def _load_caption_font(font_size: int) -> ImageFont.FreeTypeFont:
+    # Loading a font parses the font file, so each size is only loaded once.
+    return ImageFont.truetype(
+        font=str(App.PATH_FONT_CAPTION),
+        size=font_size,
+    )
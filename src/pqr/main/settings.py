@@ -1,11 +1,11 @@
 from __future__ import annotations
 
+import functools
 from collections import defaultdict
 from collections.abc import Iterator
 from datetime import datetime
-from typing import Annotated, Any, Self
+from typing import Annotated, Any, ClassVar, Self
 
-import tomli_w
 from pydantic import (
     AliasGenerator,
     BaseModel,
@@ -20,10 +20,25 @@ from .errors import InternalError
 from .shared import App, Category, Delimeter, Encoding, Key, Unit
 
 
+SETTING_TYPES: dict[str, type[Any]] = {
+    "str": str,
+    "int": int,
+    "float": float,
+    "bool": bool,
+}
+
+# The empty value for each type a setting's value can be cleared to.
+SETTING_TYPE_DEFAULTS: dict[type[Any], Any] = {
+    str: "",
+    int: 0,
+    float: 0.0,
+}
+
+
 def _preprocess_type(value: str) -> type[Any]:
     try:
-        return eval(value)
-    except NameError:
+        return SETTING_TYPES[value]
+    except KeyError:
         raise InternalError(f"Value '{value}' not a valid Python type.")  # noqa: B904
 
 
@@ -75,6 +90,10 @@ class Setting(BaseModel):
         )
     )
 
+    # Incremented whenever the value of any setting changes. This allows anything
+    # derived from the settings' values to know when it's stale.
+    revision: ClassVar[int] = 0
+
     def update(self, value: Any) -> None:
         if isinstance(value, str):
             value = value.strip()
@@ -85,30 +104,32 @@ class Setting(BaseModel):
 
         self._value = value
 
+        Setting.revision += 1
+
     def clear(self) -> None:
-        match self.type:
-            case t if t is str:
-                self._value = ""
-            case t if t is int:
-                self._value = 0
-            case t if t is float:
-                self._value = 0.0
-            case _:
-                raise TypeError(f"Unsupported type: {self.type}")
+        try:
+            self._value = SETTING_TYPE_DEFAULTS[self.type]
+        except KeyError:
+            raise TypeError(f"Unsupported type: {self.type}")  # noqa: B904
 
-    @property
+        Setting.revision += 1
+
+    # The name, category and unit never change after a setting is loaded, so anything
+    # derived from them only needs computing once.
+
+    @functools.cached_property
     def path(self) -> str:
         return self.build_fully_qualified_path(self.category, self.name)
 
-    @property
+    @functools.cached_property
     def path_normalized(self) -> str:
         return helpers.kebab_to_snake(self.path)
 
-    @property
+    @functools.cached_property
     def template_string(self) -> str:
         return f"{{{self.path}}}"
 
-    @property
+    @functools.cached_property
     def template_string_with_unit(self) -> str:
         return f"{{{self.path}}}{self.unit.value}" if self.unit else f"{{{self.path}}}"
 
@@ -117,15 +138,10 @@ class Setting(BaseModel):
         if self._value:
             return self._value
 
-        match self.type:
-            case t if t is str:
-                return ""
-            case t if t is int:
-                return 0
-            case t if t is float:
-                return 0.0
-            case _:
-                raise TypeError(f"Unsupported type: {self.type}")
+        try:
+            return SETTING_TYPE_DEFAULTS[self.type]
+        except KeyError:
+            raise TypeError(f"Unsupported type: {self.type}")  # noqa: B904
 
     @property
     def value_with_unit(self) -> str:
@@ -209,7 +225,12 @@ class PrintSettings:
     DEFAULT_LOCATION = App.PATH_DATA / App.NAME_PRINT_SETTINGS_FILE
 
     __inner: dict[str, Setting] = {}  # noqa: RUF012
+    # The same settings keyed by their normalized paths e.g. `filament_name`.
+    __inner_normalized: dict[str, Setting] = {}  # noqa: RUF012
+    # The same settings keyed by their category and name e.g. `("filament", "name")`.
+    __inner_by_category: dict[tuple[str, str], Setting] = {}  # noqa: RUF012
     __date: Setting
+    __template_context: tuple[int, TemplateContext] | None = None
 
     def load(self) -> None:
         self._load()
@@ -217,6 +238,20 @@ class PrintSettings:
     def get(self, path: str) -> Setting | None:
         return self._inner.get(path, None)
 
+    def get_by_category(self, category: str, name: str) -> Setting | None:
+        # Make sure the settings, and with them the category keys, are loaded.
+        _ = self._inner
+
+        setting = self.__inner_by_category.get((category, name))
+
+        if setting is None:
+            # Fall back to the kebab-case key e.g. for `("filament", "spool_weight")`.
+            setting = self.__inner_by_category.get(
+                (helpers.snake_to_kebab(category), helpers.snake_to_kebab(name))
+            )
+
+        return setting
+
     def clear(self) -> None:
         for setting in self.iter_settings():
             setting.clear()
@@ -231,19 +266,39 @@ class PrintSettings:
     def update(self, data: SerializedSettings) -> None:
         for category, settings in data.items():
             for name, value in settings.items():
-                path = Setting.build_fully_qualified_path(
-                    category=category,
-                    name=name,
-                )
-
-                setting = self.get(path)
+                setting = self.get_by_category(category, name)
 
                 if not setting:
+                    path = Setting.build_fully_qualified_path(
+                        category=category,
+                        name=name,
+                    )
+
                     # TODO: The data should be validated before it reaches this point.
                     raise InternalError(f"Unable to update invalid path '{path}'.")
 
                 setting.update(value)
 
+    def update_flat(self, data: dict[str, Any]) -> None:
+        """Updates settings from a flat dictionary keyed by normalized paths e.g.
+        `filament_name`, as passed in from the commandline args.
+
+        Args:
+            data (dict[str, Any]): Setting values keyed by their normalized paths.
+        """
+
+        # Make sure the settings, and with them the normalized paths, are loaded.
+        _ = self._inner
+
+        for path, value in data.items():
+            setting = self.__inner_normalized.get(path)
+
+            if not setting:
+                # TODO: The data should be validated before it reaches this point.
+                raise InternalError(f"Unable to update invalid path '{path}'.")
+
+            setting.update(value)
+
     @property
     def date(self) -> Setting:
         return self.__date
@@ -263,6 +318,14 @@ class PrintSettings:
                 return self._encode_to_str_toml(with_units, filter_empty_values=True)
 
     def to_template_context(self) -> TemplateContext:
+        # The context is cached until a setting's value changes. Callers must treat it
+        # as read-only.
+        if (
+            self.__template_context is not None
+            and self.__template_context[0] == Setting.revision
+        ):
+            return self.__template_context[1]
+
         data = {}
 
         for setting in self.iter_settings():
@@ -276,6 +339,8 @@ class PrintSettings:
 
             data[setting.path] = value
 
+        self.__template_context = (Setting.revision, data)
+
         return data
 
     def dump(self) -> str:
@@ -306,32 +371,26 @@ class PrintSettings:
                 self.__date = setting
 
             self.__inner[setting.path] = setting
+            self.__inner_normalized[setting.path_normalized] = setting
+            self.__inner_by_category[setting.category.value, setting.name] = setting
 
     def _to_dict(self, filter_empty_values: bool = False) -> SettingsDict:
-        data = defaultdict(dict)
+        data: SettingsDict = {}
 
         for setting in self.iter_settings():
-            data[setting.category.value][setting.name] = setting
-
-        if filter_empty_values is False:
-            return dict(data)
+            # Only keep settings with a non falsy value when filtering. Categories
+            # without any are left out entirely.
+            if filter_empty_values and not setting.value:
+                continue
 
-        filtered = defaultdict(dict)
+            category = setting.category.value
 
-        for category, settings in data.items():
-            settings = {  # noqa: PLW2901
-                name: setting
-                for name, setting in settings.items()
-                # Keep settings with a non falsy value.
-                if setting.value
-            }
-
-            if not settings:
-                continue
+            if category not in data:
+                data[category] = {}
 
-            filtered[category] = settings
+            data[category][setting.name] = setting
 
-        return dict(filtered)
+        return data
 
     def _encode_to_str_toml(
         self,
@@ -350,12 +409,15 @@ class PrintSettings:
 
             data[category] = category_settings
 
+        # Only needed when the settings are written out, so it's not imported up front.
+        import tomli_w
+
         return tomli_w.dumps(data, indent=2)
 
     # We don't remove empty values for the 'compact' format as this would cause an issue
     # if the data were to be parsed back into dict/TOML or other structured data.
     def _encode_to_str_compact(self, with_units: bool = False) -> str:
-        template = []
+        lines = []
 
         for setting in self.iter_settings():
             if not setting.value:
@@ -363,24 +425,20 @@ class PrintSettings:
                 # sure there's atleast a header. This allows for parsing the data
                 # back into dict/TOML or other structured data.
                 if setting.path in Category.paths():
-                    template.append(setting.category.placeholder)
+                    lines.append(setting.category.placeholder)
 
                 continue
 
-            value_template = (
-                setting.template_string_with_unit
-                if with_units
-                else setting.template_string
-            )
+            # Only settings with a value reach this point, so the value can be used
+            # directly without rendering a template.
+            value = setting.value_with_unit if with_units else setting.value
 
             if setting.compact_name is not None:
-                setting_template = f"  {setting.compact_name}={value_template}"
+                lines.append(f"  {setting.compact_name}={value}")
             else:
-                setting_template = value_template
-
-            template.append(setting_template)
+                lines.append(f"{value}")
 
-        return "\n".join(template).format(**self.to_template_context())
+        return "\n".join(lines)
 
 
 PRINT_SETTINGS = PrintSettings()
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import functools
 import re
 import unicodedata
 from enum import StrEnum
@@ -7,7 +8,6 @@ from importlib import metadata, resources
 from pathlib import Path
 from typing import TYPE_CHECKING
 
-import qrcode.constants
 from rlog import Console
 
 from .lexer import CompactLexer
@@ -24,7 +24,6 @@ class App:
     NAME = "pqr"
     NAME_FULL = "PrintQR"
 
-    VERSION = metadata.version(NAME)
     LINK_REPOSITORY = f"https://github.com/tnahs/{NAME_FULL}"
     LINK_DOCUMENTATION = f"https://tnahs.github.io/{NAME_FULL}"
 
@@ -42,6 +41,13 @@ class App:
 
     DEFAULT_EDITOR = "vi"
 
+    # Reading the package metadata scans the installed distributions, so the version is
+    # only looked up when it's shown.
+    @classmethod
+    @functools.cache
+    def version(cls) -> str:
+        return metadata.version(cls.NAME)
+
 
 QR_CODE_VERSION_MIN = 1
 QR_CODE_VERSION_MAX = 40
@@ -67,10 +73,11 @@ class Category(StrEnum):
     # TODO: This might not be the best place for either of the follwing methods.
 
     @classmethod
-    def paths(cls) -> list[str]:
-        return [f"{variant.value}-name" for variant in cls]
+    @functools.cache
+    def paths(cls) -> tuple[str, ...]:
+        return tuple(f"{variant.value}-name" for variant in cls)
 
-    @property
+    @functools.cached_property
     def placeholder(self) -> str:
         return f"[{self.value}]"
 
@@ -81,6 +88,13 @@ class Unit(StrEnum):
     TEMPERATURE = "°C"
 
 
+# Lexers don't hold any state between highlights, so a single instance is shared. It's
+# only created once something is highlighted.
+@functools.cache
+def _get_compact_lexer() -> Lexer:
+    return CompactLexer()
+
+
 class Encoding(StrEnum):
     TOML = "toml"
     COMPACT = "compact"
@@ -91,7 +105,7 @@ class Encoding(StrEnum):
             case Encoding.TOML:
                 return "toml"
             case _:
-                return CompactLexer()
+                return _get_compact_lexer()
 
 
 class Delimeter(StrEnum):
@@ -99,6 +113,10 @@ class Delimeter(StrEnum):
     KEBAB = "-"
 
 
+SPACES_AND_DASHES_PATTERN = re.compile(r"[\s-]+")
+SPACES_AND_UNDERSCORES_PATTERN = re.compile(r"[\s_]+")
+
+
 class StringTransformation(StrEnum):
     TO_ASCII = "to-ascii"
     TO_LOWERCASE = "to-lowercase"
@@ -107,8 +125,9 @@ class StringTransformation(StrEnum):
     SPACES_TO_UNDERSCORES = "spaces-to-underscores"
 
     @classmethod
-    def choices(cls) -> list[str]:
-        return [variant.value for variant in cls]
+    @functools.cache
+    def choices(cls) -> tuple[str, ...]:
+        return tuple(variant.value for variant in cls)
 
     @property
     def description(self) -> str:
@@ -129,6 +148,10 @@ class StringTransformation(StrEnum):
     def apply(self, string: str) -> str:
         match self:
             case StringTransformation.TO_ASCII:
+                # ASCII strings are unchanged by the normalization below.
+                if string.isascii():
+                    return string
+
                 return (
                     unicodedata.normalize("NFKD", string)
                     .encode("ascii", "ignore")
@@ -137,11 +160,12 @@ class StringTransformation(StrEnum):
             case StringTransformation.TO_LOWERCASE:
                 return string.lower()
             case StringTransformation.REMOVE_SPACES:
-                return string.replace(" ", "")
+                # Like the other transformations, treat any whitespace as spaces.
+                return "".join(string.split())
             case StringTransformation.SPACES_TO_DASHES:
-                return re.sub(r"[\s-]+", "-", string)
+                return SPACES_AND_DASHES_PATTERN.sub("-", string)
             case StringTransformation.SPACES_TO_UNDERSCORES:
-                return re.sub(r"[\s_]+", "_", string)
+                return SPACES_AND_UNDERSCORES_PATTERN.sub("_", string)
             case _:
                 raise ValueError(f"Missing implementation for: {self}")
 
@@ -150,6 +174,8 @@ class ImageFormat(StrEnum):
     PNG = "png"
     JPG = "jpg"
 
+    # Members live as long as the class, so caching by member doesn't leak.
+    @functools.cache  # noqa: B019
     def to_suffix(self) -> str:
         return f".{self.value}"
 
@@ -161,6 +187,10 @@ class ErrorCorrection(StrEnum):
     HIGH = "high"
 
     def to_const(self) -> int:
+        # Imported here to keep the qrcode package, and Pillow with it, out of commands
+        # that never generate a QR Code.
+        import qrcode.constants
+
         match self:
             case self.LOW:
                 return qrcode.constants.ERROR_CORRECT_L
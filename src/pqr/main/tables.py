@@ -1,7 +1,10 @@
 from __future__ import annotations
 
+import functools
+import itertools
 import textwrap
 from datetime import datetime
+from operator import attrgetter
 
 from rich.console import Group
 from rich.padding import Padding
@@ -12,7 +15,8 @@ from .settings import PRINT_SETTINGS
 from .shared import StringTransformation
 
 
-def _generate_table_template_fields() -> Padding:
+@functools.cache
+def generate_table_template_fields() -> Padding:
     style1 = "cyan"
     style2 = "green"
     accent_style1 = "yellow"
@@ -42,25 +46,25 @@ def _generate_table_template_fields() -> Padding:
             style=style2,
         )
 
-    category = None
-
-    for setting in PRINT_SETTINGS.iter_settings():
-        if category is None:
-            category = setting.category
+    groups = itertools.groupby(
+        PRINT_SETTINGS.iter_settings(), key=attrgetter("category")
+    )
 
-        if category != setting.category:
-            category = setting.category
+    for index, (_, settings) in enumerate(groups):
+        # Separate each category with a section.
+        if index > 0:
             table.add_section()
 
-        table.add_row(
-            setting.category,
-            setting.name,
-            setting.compact_name or empty_value,
-            setting.template_string,
-            setting.type.__name__,
-            setting.unit or empty_value,
-            setting.description.capitalize(),
-        )
+        for setting in settings:
+            table.add_row(
+                setting.category,
+                setting.name,
+                setting.compact_name or empty_value,
+                setting.template_string,
+                setting.type.__name__,
+                setting.unit or empty_value,
+                setting.description.capitalize(),
+            )
 
     return Padding(
         table,
@@ -68,7 +72,8 @@ def _generate_table_template_fields() -> Padding:
     )
 
 
-def _generate_table_template_date() -> Padding:
+@functools.cache
+def generate_table_template_date() -> Padding:
     style1 = "cyan"
     style2 = "green"
     accent_style1 = "yellow"
@@ -142,7 +147,8 @@ def _generate_table_template_date() -> Padding:
     )
 
 
-def _generate_table_string_transformations() -> Padding:
+@functools.cache
+def generate_table_string_transformations() -> Padding:
     style1 = "cyan"
     style2 = "green"
     accent_style1 = "yellow"
@@ -199,8 +205,3 @@ def _generate_table_string_transformations() -> Padding:
         group,
         **ui.TABLE_PADDING,
     )
-
-
-TABLE_TEMPLATES_FIELDS = _generate_table_template_fields()
-TABLE_TEMPLATES_DATE = _generate_table_template_date()
-TABLE_STRING_TRANSFORMATIONS = _generate_table_string_transformations()
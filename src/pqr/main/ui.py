@@ -15,6 +15,7 @@ from .shared import console
 
 
 INDENT = "   "
+INDENT_WIDTH = len(INDENT)
 
 MISSING = "?"
 
@@ -41,22 +42,17 @@ TABLE_STYLE = {
 }
 
 TABLE_PADDING = {
-    #       t  r            b  l
-    "pad": (1, len(INDENT), 0, len(INDENT)),
+    #       t  r             b  l
+    "pad": (1, INDENT_WIDTH, 0, INDENT_WIDTH),
     "expand": False,
 }
 
 
 def table(title: str, **kwargs) -> Table:
-    # Make a local copy to avoid mutating the original.
-    table_style = TABLE_STYLE.copy()
-
-    # Overwrite panel stlye values with those in kwargs.
-    table_style.update(kwargs)
-
+    # Overwrite table style values with those in kwargs, without mutating the original.
     return Table(
         title=title,
-        **table_style,
+        **{**TABLE_STYLE, **kwargs},
     )
 
 
@@ -66,8 +62,12 @@ def table(title: str, **kwargs) -> Table:
 #                t  r  b  l
 PADDING_INNER = (1, 3, 1, 3)
 
-#                t  r            b  l
-PADDING_OUTER = (1, len(INDENT), 1, len(INDENT))
+#                t  r             b  l
+PADDING_OUTER = (1, INDENT_WIDTH, 1, INDENT_WIDTH)
+
+# For panels followed directly by more output.
+#                          t  r             b  l
+PADDING_OUTER_NO_BOTTOM = (1, INDENT_WIDTH, 0, INDENT_WIDTH)
 
 
 PANEL_STYLE = {
@@ -88,15 +88,10 @@ def panel(
     if pretty is True:
         renderable = Pretty(renderable, expand_all=True)
 
-    # Make a local copy to avoid mutating the original.
-    panel_style = PANEL_STYLE.copy()
-
-    # Overwrite panel stlye values with those in kwargs.
-    panel_style.update(kwargs)
-
+    # Overwrite panel style values with those in kwargs, without mutating the original.
     panel = Panel(
         renderable=renderable,
-        **panel_style,  # pyright: ignore [reportArgumentType]
+        **{**PANEL_STYLE, **kwargs},  # pyright: ignore [reportArgumentType]
     )
 
     return Padding(
@@ -134,7 +129,7 @@ def get_char_max_width(string: str) -> int:
     Returns:
         int: Length of the longest line.
     """
-    return max(len(line) for line in string.splitlines())
+    return max(map(len, string.splitlines()))
 
 
 def pad_lines(string: str, width: int) -> str:
@@ -0,0 +1,70 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import pytest
+
+from pqr.main.config import ConfigManager
+from pqr.main.errors import ConfigValidationError
+from pqr.main.settings import PRINT_SETTINGS
+
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+
+@pytest.fixture
+def write_override(tmp_path: Path, monkeypatch: pytest.MonkeyPatch):
+    """Returns a function writing a user config file that's loaded over the defaults."""
+
+    path = tmp_path / "pqr.toml"
+
+    monkeypatch.setattr(ConfigManager, "OVERRIDE_LOCATIONS", (path,))
+
+    def write(contents: str) -> Path:
+        path.write_text(contents)
+        return path
+
+    return write
+
+
+def test_invalid_print_settings_keys_are_reported_together(write_override) -> None:
+    path = write_override(
+        "[print-settings.filament]\n"
+        "bogus = 1\n"
+        "\n"
+        "[print-settings.printer]\n"
+        'nope = "x"\n'
+    )
+
+    with pytest.raises(ConfigValidationError) as error:
+        ConfigManager().load(user=True)
+
+    assert error.value.path == path
+    assert [(e["loc"], e["input"]) for e in error.value.source.errors()] == [
+        (("print-settings", "filament"), "bogus"),
+        (("print-settings", "printer"), "nope"),
+    ]
+
+
+def test_snake_case_print_settings_keys_are_validated(write_override) -> None:
+    write_override('[print-settings.printer]\nnozzle_size = "wide"\n')
+
+    with pytest.raises(ConfigValidationError) as error:
+        ConfigManager().load(user=True)
+
+    # The key is found as `printer-nozzle-size`, so its value fails the type check.
+    assert [(e["loc"], e["input"]) for e in error.value.source.errors()] == [
+        (("print-settings", "printer.nozzle_size"), "wide"),
+    ]
+
+
+def test_snake_case_print_settings_keys_update_settings(write_override) -> None:
+    write_override("[print-settings.printer]\nnozzle_size = 0.6\n")
+
+    ConfigManager().load(user=True)
+
+    setting = PRINT_SETTINGS.get("printer-nozzle-size")
+
+    assert setting is not None
+    assert setting.value == 0.6